@@ -4,15 +4,26 @@ Flask backend with service health checks and system stats
 """
 
 import os
+import atexit
 import json
+import functools
+import hashlib
+import http.client
+import mimetypes
 import time
+import socket
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from email.utils import formatdate
-from datetime import datetime
+from datetime import date, datetime
+from enum import IntFlag
+from typing import NamedTuple
+from urllib.parse import quote
+from werkzeug.security import safe_join
 from flask import Flask, render_template, jsonify, Response, send_from_directory, abort, request, make_response, redirect
 import requests
 import psutil
-import shutil
 
 # Unlock token for showing service links through Cloudflare Tunnel
 # Visit aern.dev/?unlock=<token> to set cookie, ?lock to clear
@@ -30,14 +41,22 @@ def _is_internal_request():
     return bool(UNLOCK_TOKEN and request.cookies.get("aern_internal") == UNLOCK_TOKEN)
 
 try:
-    import docker
+    import orjson
 
-    DOCKER_AVAILABLE = True
+    ORJSON_AVAILABLE = True
 except ImportError:
-    DOCKER_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Docker Engine API endpoint, same convention as the docker CLI
+DOCKER_HOST = os.environ.get("DOCKER_HOST", "unix:///var/run/docker.sock")
+if DOCKER_HOST.startswith("unix://"):
+    DOCKER_AVAILABLE = os.path.exists(DOCKER_HOST[len("unix://"):])
+else:
+    DOCKER_AVAILABLE = DOCKER_HOST.startswith("tcp://")
 
 app = Flask(__name__)
-app.config["SECRET_KEY"] = os.urandom(24)
+# Set SECRET_KEY so sessions survive restarts; the random fallback is per-process
+app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY") or os.urandom(24)
 
 
 @app.after_request
@@ -47,10 +66,29 @@ def set_security_headers(response):
     response.headers["Referrer-Policy"] = "no-referrer"
     return response
 
+def _json(obj):
+    """JSON response for the polled API endpoints; uses orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return Response(orjson.dumps(obj), mimetype="application/json")
+    return jsonify(obj)
+
 # Configuration
 DATA_DIR = os.environ.get("DATA_DIR", "C:/projects/aernhome/data")
 DB_PATH = os.path.join(DATA_DIR, "dashboard.db")
 HTTP_TIMEOUT = 5  # seconds
+HEALTH_CHECK_INTERVAL = 30  # seconds between background health check rounds
+HEALTH_CHECK_BUDGET = HTTP_TIMEOUT + 1  # seconds; a round waits at most this long for all checks
+HEALTH_SAVE_INTERVAL = 60  # seconds; at most one health_checks row per service per interval
+STATS_REFRESH_INTERVAL = 15  # seconds between background /api/stats recomputes (dashboard polls every 30s)
+HTTP_BACKOFF_MAX = 300  # seconds; longest gap between probes of a service that keeps failing
+
+# Shared HTTP session so health probes reuse keep-alive connections
+_http = requests.Session()
+_http_adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+_http.mount("http://", _http_adapter)
+_http.mount("https://", _http_adapter)
+_http.headers.update({"User-Agent": "AernHome-HealthCheck/1.0", "Connection": "keep-alive"})
+atexit.register(_http.close)
 
 # Default services configuration
 DEFAULT_SERVICES = [
@@ -156,18 +194,31 @@ DEFAULT_SERVICES = [
     },
 ]
 
+# Service name -> public URL, built once for the /api/health hot path
+PUBLIC_URLS: dict[str, str | None] = {s["name"]: s.get("public_url") for s in DEFAULT_SERVICES}
+
 
 def init_db():
     """Initialize SQLite database with services and health_checks tables"""
     os.makedirs(DATA_DIR, exist_ok=True)
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     cursor = conn.cursor()
 
+    # WAL lets the sparkline reads run alongside inserts. journal_mode is
+    # persistent; the per-connection pragmas are applied in get_db()
+    cursor.execute("PRAGMA journal_mode=WAL")
+
+    # Incremental auto-vacuum lets the pruner hand freed pages back to the OS.
+    # Existing databases need a one-time VACUUM for the setting to apply.
+    if cursor.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        cursor.execute("VACUUM")
+
     # Create services table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS services (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER PRIMARY KEY,
             name TEXT UNIQUE NOT NULL,
             display_name TEXT NOT NULL,
             url TEXT,
@@ -182,7 +233,7 @@ def init_db():
     # Create health_checks table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS health_checks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER PRIMARY KEY,
             service_id INTEGER NOT NULL,
             status TEXT NOT NULL,
             response_time_ms INTEGER,
@@ -192,38 +243,109 @@ def init_db():
         )
     """)
 
-    # Seed default services (insert any missing)
-    for service in DEFAULT_SERVICES:
-        cursor.execute("SELECT id FROM services WHERE name = ?", (service["name"],))
-        if cursor.fetchone() is None:
-            cursor.execute(
-                """
-                INSERT INTO services (name, display_name, url, check_type, docker_container, icon_emoji, enabled)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    service["name"],
-                    service["display_name"],
-                    service["url"],
-                    service["check_type"],
-                    service["docker_container"],
-                    service["icon_emoji"],
-                    service["enabled"],
-                ),
-            )
+    # Indexes for retention pruning and the per-service sparkline query
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_health_checked_at ON health_checks (checked_at)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_health_service_time ON health_checks (service_id, checked_at)"
+    )
+
+    # Seed default services (insert any missing; the UNIQUE name index skips existing rows)
+    cursor.executemany(
+        """
+        INSERT OR IGNORE INTO services (name, display_name, url, check_type, docker_container, icon_emoji, enabled)
+        VALUES (:name, :display_name, :url, :check_type, :docker_container, :icon_emoji, :enabled)
+    """,
+        DEFAULT_SERVICES,
+    )
 
     conn.commit()
     conn.close()
     print(f"Database initialized at {DB_PATH}")
 
 
-def get_db():
-    """Get database connection"""
-    conn = sqlite3.connect(DB_PATH)
+def start_background_workers():
+    """Start the daemon threads that keep health and stats data fresh"""
+    # Prime psutil so later cpu_percent(interval=None) calls have a baseline
+    psutil.cpu_percent(interval=None)
+
+    threading.Thread(target=_cpu_sampler_loop, daemon=True).start()
+    threading.Thread(target=_stats_refresh_loop, daemon=True).start()
+    threading.Thread(target=_health_check_loop, daemon=True).start()
+    threading.Thread(target=_prune_health_checks_loop, daemon=True).start()
+
+
+# Latest CPU utilisation, sampled once a second by _cpu_sampler_loop;
+# None if sampling failed
+_cpu_percent = 0.0
+
+
+def _cpu_sampler_loop():
+    """Background thread: sample CPU usage over consecutive 1s windows."""
+    global _cpu_percent
+    while True:
+        time.sleep(1.0)
+        try:
+            _cpu_percent = psutil.cpu_percent(interval=None)
+        except Exception:
+            _cpu_percent = None
+
+
+def _prune_health_checks_loop():
+    """Background thread: drop health checks older than 7 days at startup and then hourly."""
+    while True:
+        try:
+            conn = get_thread_db()
+            conn.execute(
+                "DELETE FROM health_checks WHERE checked_at < datetime('now', '-7 days')"
+            )
+            # execute() steps the pragma once, freeing a single page;
+            # executescript runs it to completion and empties the freelist
+            conn.executescript("PRAGMA incremental_vacuum;")
+        except sqlite3.Error as e:
+            print(f"Health check pruning failed: {e}")
+        time.sleep(3600)
+
+
+def get_db(**connect_kwargs):
+    """Get database connection with per-connection performance pragmas applied"""
+    conn = sqlite3.connect(DB_PATH, **connect_kwargs)
     conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
+        PRAGMA mmap_size=268435456;
+        PRAGMA busy_timeout=2000;
+    """)
+    return conn
+
+
+_db_local = threading.local()
+
+
+def get_thread_db():
+    """Get this thread's long-lived connection; never close it
+
+    Used by the background writers and by request handlers, whose waitress
+    worker threads are long-lived too, so pragmas run once per thread and the
+    prepared statement cache survives between requests.
+
+    The connection is in autocommit mode (isolation_level=None); multi-row
+    writes open their own BEGIN IMMEDIATE ... COMMIT.
+    """
+    conn = getattr(_db_local, "conn", None)
+    if conn is None:
+        conn = _db_local.conn = get_db(isolation_level=None, cached_statements=64)
     return conn
 
 
+# URLs whose HEAD answer can't be trusted (405/501, or a failure that GET
+# contradicted); probed with GET from then on
+_head_unsupported = set()
+
+
 def check_http_health(url):
     """
     Check HTTP endpoint health
@@ -231,7 +353,17 @@ def check_http_health(url):
     """
     try:
         start = time.time()
-        response = requests.get(url, timeout=HTTP_TIMEOUT, allow_redirects=True)
+        # HEAD skips the response body; any failing HEAD is retried with GET,
+        # since some servers only route GET
+        if url in _head_unsupported:
+            response = _http.get(url, timeout=HTTP_TIMEOUT, allow_redirects=True)
+        else:
+            response = _http.head(url, timeout=HTTP_TIMEOUT, allow_redirects=True)
+            if response.status_code not in (200, 302):
+                head_status = response.status_code
+                response = _http.get(url, timeout=HTTP_TIMEOUT, allow_redirects=True)
+                if head_status in (405, 501) or response.status_code in (200, 302):
+                    _head_unsupported.add(url)
         response_time = int((time.time() - start) * 1000)
 
         # 200 or 302 (redirects) count as success
@@ -247,51 +379,197 @@ def check_http_health(url):
         return ("down", None, str(e))
 
 
-def check_docker_health(container_name):
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a UNIX domain socket (the Docker daemon socket)."""
+
+    def __init__(self, socket_path, timeout):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+_docker_lock = threading.Lock()
+_docker_conn = None
+
+
+def _new_docker_conn():
+    if DOCKER_HOST.startswith("unix://"):
+        return _UnixHTTPConnection(DOCKER_HOST[len("unix://"):], HTTP_TIMEOUT)
+    return http.client.HTTPConnection(DOCKER_HOST[len("tcp://"):], timeout=HTTP_TIMEOUT)
+
+
+def _docker_get(path):
+    """
+    GET a Docker Engine API path and return the decoded JSON.
+    The connection is kept alive between calls; one the daemon has dropped is
+    replaced once. Timeouts and other errors are raised straight away.
     """
-    Check Docker container status
+    global _docker_conn
+    with _docker_lock:
+        for attempt in range(2):
+            if _docker_conn is None:
+                _docker_conn = _new_docker_conn()
+            try:
+                _docker_conn.request("GET", path)
+                response = _docker_conn.getresponse()
+                body = response.read()
+                break
+            except (ConnectionResetError, BrokenPipeError, http.client.RemoteDisconnected):
+                _docker_conn.close()
+                _docker_conn = None
+                if attempt:
+                    raise
+            except (OSError, http.client.HTTPException):
+                _docker_conn.close()
+                _docker_conn = None
+                raise
+    if response.status >= 400:
+        raise RuntimeError(f"Docker API HTTP {response.status}")
+    return json.loads(body)
+
+
+_docker_snapshot = {"ts": 0.0, "map": {}, "error": None}
+_docker_snapshot_lock = threading.Lock()
+
+
+def _docker_status_map(ttl=2.0):
+    """
+    Return {container_name: status} for all containers.
+    One containers.list() call serves every check within the TTL window.
+    A failed fetch is cached too, so callers don't queue up retrying it.
+    """
+    with _docker_snapshot_lock:
+        if time.time() - _docker_snapshot["ts"] > ttl:
+            try:
+                containers = _docker_get("/containers/json?all=1")
+            except Exception as e:
+                _docker_snapshot["error"] = str(e) or type(e).__name__
+            else:
+                # Legacy link aliases ("/web/db") are extra Names entries;
+                # keying on the primary name keeps one entry per container
+                _docker_snapshot["map"] = {
+                    name[1:]: c["State"]
+                    for c in containers
+                    for name in c["Names"]
+                    if name.count("/") == 1
+                }
+                _docker_snapshot["error"] = None
+            # Stamped after the fetch so a slow failure still gets its full TTL
+            _docker_snapshot["ts"] = time.time()
+        if _docker_snapshot["error"] is not None:
+            raise RuntimeError(_docker_snapshot["error"])
+        return _docker_snapshot["map"]
+
+
+_docker_info_cache = {"ts": 0.0, "info": None}
+
+
+def _docker_info(ttl=60.0):
+    """Return the daemon's /info; host metadata rarely changes, so cache it."""
+    with _docker_snapshot_lock:
+        now = time.time()
+        if _docker_info_cache["info"] is None or now - _docker_info_cache["ts"] > ttl:
+            _docker_info_cache["info"] = _docker_get("/info")
+            _docker_info_cache["ts"] = now
+        return _docker_info_cache["info"]
+
+
+def check_docker_health(container_name, container_statuses=None, snapshot_error=None):
+    """
+    Check Docker container status against a {name: status} snapshot
+    (fetched here if the caller didn't pass one or the error fetching it)
     Returns: (status, error_message)
     """
     if not DOCKER_AVAILABLE:
-        return ("unknown", "Docker library not available")
+        return ("unknown", "Docker socket not available")
+    if snapshot_error is not None:
+        return ("down", snapshot_error)
 
     try:
-        client = docker.from_env()
-        container = client.containers.get(container_name)
+        if container_statuses is None:
+            container_statuses = _docker_status_map()
+        status = container_statuses.get(container_name)
 
-        if container.status == "running":
+        if status is None:
+            return ("down", "Container not found")
+        elif status == "running":
             return ("up", None)
         else:
-            return ("down", f"Container status: {container.status}")
-    except docker.errors.NotFound:
-        return ("down", "Container not found")
+            return ("down", f"Container status: {status}")
     except Exception as e:
         return ("down", str(e))
 
 
-def check_service_health(service):
+class CheckType(IntFlag):
+    """Which probes a service gets; stored in the DB as 'http', 'docker' or 'both'."""
+
+    HTTP = 1
+    DOCKER = 2
+
+
+_CHECK_TYPES = {
+    "http": CheckType.HTTP,
+    "docker": CheckType.DOCKER,
+    "both": CheckType.HTTP | CheckType.DOCKER,
+}
+
+
+# Services whose HTTP probe keeps failing: name -> (next_probe_at, consecutive_fails, last_result)
+_backoff: dict[str, tuple[float, int, tuple]] = {}
+# Enough consecutive failures for 2**fails to reach HTTP_BACKOFF_MAX; counting stops there
+_BACKOFF_MAX_FAILS = HTTP_BACKOFF_MAX.bit_length()
+
+
+def _check_http_with_backoff(name, url):
+    """
+    HTTP check that backs off exponentially while a service stays down
+    Within the backoff window the last failure is returned without probing
+    Returns: ((status, response_time_ms, error_message), probed)
+    """
+    now = time.monotonic()
+    state = _backoff.get(name)
+    if state is not None and now < state[0]:
+        return state[2], False
+    result = check_http_health(url)
+    if result[0] == "up":
+        _backoff.pop(name, None)
+    else:
+        fails = min(state[1] + 1, _BACKOFF_MAX_FAILS) if state is not None else 1
+        _backoff[name] = (now + min(HTTP_BACKOFF_MAX, 2**fails), fails, result)
+    return result, True
+
+
+def check_service_health(service, container_statuses=None, snapshot_error=None):
     """
     Check overall service health based on check_type
-    Returns: dict with status, response_time_ms, error_message
+    Returns: dict with status, response_time_ms, error_message and probed
+    (False when the HTTP result is a cached failure from the backoff window)
     """
-    result = {"status": "unknown", "response_time_ms": None, "error_message": None}
+    result = {"status": "unknown", "response_time_ms": None, "error_message": None, "probed": True}
 
-    check_type = service["check_type"]
+    check_type = _CHECK_TYPES.get(service["check_type"], CheckType(0))
 
     # HTTP check
-    if check_type in ["http", "both"] and service["url"]:
-        http_status, response_time, error = check_http_health(service["url"])
+    if check_type & CheckType.HTTP and service["url"]:
+        (http_status, response_time, error), result["probed"] = _check_http_with_backoff(
+            service["name"], service["url"]
+        )
         result["status"] = http_status
         result["response_time_ms"] = response_time
         result["error_message"] = error
 
     # Docker check (only if HTTP passed or HTTP not applicable)
-    if check_type in ["docker", "both"] and service["docker_container"]:
-        if check_type == "docker" or result["status"] == "up":
+    if check_type & CheckType.DOCKER and service["docker_container"]:
+        if check_type == CheckType.DOCKER or result["status"] == "up":
             docker_status, docker_error = check_docker_health(
-                service["docker_container"]
+                service["docker_container"], container_statuses, snapshot_error
             )
-            if check_type == "docker":
+            if check_type == CheckType.DOCKER:
                 result["status"] = docker_status
                 result["error_message"] = docker_error
             elif docker_status != "up":
@@ -302,23 +580,154 @@ def check_service_health(service):
     return result
 
 
-def save_health_check(service_id, status, response_time_ms, error_message):
-    """Save health check result to database and prune old records"""
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        INSERT INTO health_checks (service_id, status, response_time_ms, error_message)
-        VALUES (?, ?, ?, ?)
-    """,
-        (service_id, status, response_time_ms, error_message),
-    )
-    # Prune records older than 7 days
-    cursor.execute(
-        "DELETE FROM health_checks WHERE checked_at < datetime('now', '-7 days')"
-    )
-    conn.commit()
-    conn.close()
+# Kept as one constant so the connection's statement cache always hits
+_INSERT_HEALTH_CHECK_SQL = (
+    "INSERT INTO health_checks (service_id, status, response_time_ms, error_message) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+
+def save_health_checks(rows):
+    """Save a batch of (service_id, status, response_time_ms, error_message) rows in one transaction"""
+    if not rows:
+        return
+    conn = get_thread_db()
+    # Take the write lock up front so the batch never has to upgrade mid-way
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(_INSERT_HEALTH_CHECK_SQL, rows)
+        conn.execute("COMMIT")
+    except BaseException:
+        # A failed COMMIT can leave the transaction open; never let it outlive this call
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+# Latest probe result per service id, published by the background loop
+_health_results: dict[int, dict] = {}
+# Monotonic time of the last health_checks insert per service id
+_health_saved_at: dict[int, float] = {}
+_health_lock = threading.Lock()
+# Worker threads are reused across rounds; stragglers past the budget finish
+# in the background and their results are discarded
+_HEALTH_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="health-check")
+
+
+_services_cache = {"ts": 0.0, "value": None}
+
+
+def _load_services(ttl=30.0):
+    """Return enabled services as dicts; the table rarely changes, so cache it for ttl seconds"""
+    now = time.monotonic()
+    if _services_cache["value"] is None or now - _services_cache["ts"] > ttl:
+        rows = get_thread_db().execute("""
+            SELECT id, name, display_name, url, check_type, docker_container, icon_emoji
+            FROM services
+            WHERE enabled = 1
+        """).fetchall()
+        _services_cache["value"] = [dict(row) for row in rows]
+        _services_cache["ts"] = now
+    return _services_cache["value"]
+
+
+def run_health_checks():
+    """
+    Probe all enabled services concurrently, publish the results for
+    /api/health and persist them (throttled per service).
+    """
+    services = _load_services()
+    if not services:
+        return
+
+    # One container listing per round, shared by every Docker check. If it
+    # fails, every Docker check reports that error instead of refetching.
+    container_statuses = None
+    snapshot_error = None
+    if DOCKER_AVAILABLE:
+        try:
+            container_statuses = _docker_status_map()
+        except Exception as e:
+            snapshot_error = str(e)
+
+    # Anything still pending after the budget is reported as unknown
+    fresh = {}
+    placeholders = {}
+    futures = {
+        _HEALTH_POOL.submit(
+            check_service_health, service, container_statuses, snapshot_error
+        ): service["id"]
+        for service in services
+    }
+    try:
+        for future in as_completed(futures, timeout=HEALTH_CHECK_BUDGET):
+            fresh[futures[future]] = future.result()
+    except FuturesTimeoutError:
+        for future, service_id in futures.items():
+            if service_id not in fresh:
+                future.cancel()
+                placeholders[service_id] = {
+                    "status": "unknown",
+                    "response_time_ms": None,
+                    "error_message": "check budget exceeded",
+                }
+
+    # Persist only real probe results, not budget placeholders or backoff replays
+    now = time.monotonic()
+    rows = []
+    with _health_lock:
+        _health_results.update(placeholders)
+        for service_id, health in fresh.items():
+            _health_results[service_id] = health
+            if not health["probed"]:
+                continue
+            if now - _health_saved_at.get(service_id, float("-inf")) >= HEALTH_SAVE_INTERVAL:
+                _health_saved_at[service_id] = now
+                rows.append(
+                    (
+                        service_id,
+                        health["status"],
+                        health["response_time_ms"],
+                        health["error_message"],
+                    )
+                )
+    save_health_checks(rows)
+
+
+def _health_check_loop():
+    """Background thread: run a health check round every HEALTH_CHECK_INTERVAL seconds."""
+    while True:
+        try:
+            run_health_checks()
+        except Exception as e:
+            print(f"Health check round failed: {e}")
+        time.sleep(HEALTH_CHECK_INTERVAL)
+
+
+_nas_cache = {"mtime_ns": None, "data": None}
+
+
+def _load_nas_stats(path):
+    """Parse nas_stats.json, reusing the last parse while the file's mtime is unchanged."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    if mtime_ns != _nas_cache["mtime_ns"]:
+        with open(path, "rb") as f:
+            raw = f.read()
+        _nas_cache["data"] = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        _nas_cache["mtime_ns"] = mtime_ns
+    return _nas_cache["data"]
+
+
+INV_GB = 1 / (1024**3)
+
+
+def _disk(path):
+    """Return (total, used, free) bytes for a mount; same figures as shutil.disk_usage"""
+    st = os.statvfs(path)
+    total = st.f_blocks * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    return total, used, free
 
 
 def get_system_stats():
@@ -364,44 +773,36 @@ def get_system_stats():
     # Docker stats
     if DOCKER_AVAILABLE:
         try:
-            client = docker.from_env()
-            containers = client.containers.list(all=True)
-            stats["docker"]["total"] = len(containers)
+            statuses = _docker_status_map().values()
+            stats["docker"]["total"] = len(statuses)
             stats["docker"]["running"] = len(
-                [c for c in containers if c.status == "running"]
+                [s for s in statuses if s == "running"]
             )
         except Exception as e:
             stats["docker"]["error"] = str(e)
     else:
-        stats["docker"]["error"] = "Docker library not available"
+        stats["docker"]["error"] = "Docker socket not available"
 
-    # C: Drive stats (Ashaman local storage) - mounted as /host_c
-    try:
-        c_usage = shutil.disk_usage("/host_c")
-        stats["c_drive"]["total_gb"] = round(c_usage.total / (1024**3), 1)
-        stats["c_drive"]["used_gb"] = round(c_usage.used / (1024**3), 1)
-        stats["c_drive"]["free_gb"] = round(c_usage.free / (1024**3), 1)
-        stats["c_drive"]["percent"] = round((c_usage.used / c_usage.total) * 100, 1)
-    except Exception as e:
-        stats["c_drive"]["error"] = str(e)
-
-    # G: Drive stats (Ashaman Docker disk) - mounted as /host_g
-    try:
-        g_usage = shutil.disk_usage("/host_g")
-        stats["g_drive"]["total_gb"] = round(g_usage.total / (1024**3), 1)
-        stats["g_drive"]["used_gb"] = round(g_usage.used / (1024**3), 1)
-        stats["g_drive"]["free_gb"] = round(g_usage.free / (1024**3), 1)
-        stats["g_drive"]["percent"] = round((g_usage.used / g_usage.total) * 100, 1)
-    except Exception as e:
-        stats["g_drive"]["error"] = str(e)
+    # Local drives on Ashaman, bind-mounted into the container:
+    # C: local storage at /host_c, G: Docker disk at /host_g
+    for drive_key, mount in (("c_drive", "/host_c"), ("g_drive", "/host_g")):
+        try:
+            total, used, free = _disk(mount)
+            stats[drive_key].update(
+                total_gb=round(total * INV_GB, 1),
+                used_gb=round(used * INV_GB, 1),
+                free_gb=round(free * INV_GB, 1),
+                percent=round(used / total * 100, 1),
+            )
+        except Exception as e:
+            stats[drive_key]["error"] = str(e)
 
     # NAS drive stats (Synology) - read from host-side JSON
     try:
         nas_stats_path = os.path.join(
             os.environ.get("DATA_DIR", "/data"), "nas_stats.json"
         )
-        with open(nas_stats_path, "r") as f:
-            nas = json.load(f)
+        nas = _load_nas_stats(nas_stats_path)
         for drive_key in ("h_drive", "i_drive"):
             if drive_key in nas:
                 drive_data = nas[drive_key]
@@ -422,20 +823,20 @@ def get_system_stats():
     # CPU and RAM stats - Get from Docker host info instead of container
     if DOCKER_AVAILABLE:
         try:
-            client = docker.from_env()
-            info = client.info()
+            info = _docker_info()
 
             # CPU - Docker doesn't expose live CPU%, use psutil as fallback
             # This will show container CPU but better than nothing
-            try:
-                stats["cpu"]["percent"] = round(psutil.cpu_percent(interval=0.1), 1)
-            except:
+            # Non-blocking: last 1s sample from the background sampler
+            if _cpu_percent is not None:
+                stats["cpu"]["percent"] = round(_cpu_percent, 1)
+            else:
                 stats["cpu"]["percent"] = 0
                 stats["cpu"]["error"] = "CPU monitoring unavailable"
 
             # RAM - Get host memory from Docker info
             total_mem_bytes = info.get("MemTotal", 0)
-            stats["ram"]["total_gb"] = round(total_mem_bytes / (1024**3), 1)
+            stats["ram"]["total_gb"] = round(total_mem_bytes * INV_GB, 1)
 
             # Calculate used memory from Docker stats
             # MemTotal - MemFree (approximation since Docker doesn't expose exact used)
@@ -444,7 +845,7 @@ def get_system_stats():
                 mem = psutil.virtual_memory()
                 # Use host total from Docker, but calculate used% from actual available
                 stats["ram"]["used_gb"] = round(
-                    (total_mem_bytes - mem.available) / (1024**3), 1
+                    (total_mem_bytes - mem.available) * INV_GB, 1
                 )
                 stats["ram"]["percent"] = round(
                     (1 - (mem.available / total_mem_bytes)) * 100, 1
@@ -487,6 +888,38 @@ def get_system_stats():
     return stats
 
 
+_stats_cache = {"ts": 0.0, "value": None}
+_stats_lock = threading.Lock()
+
+
+def get_system_stats_cached(ttl=2 * STATS_REFRESH_INTERVAL):
+    """
+    Return get_system_stats(), recomputed at most once per ttl seconds.
+    The ttl outlasts a refresh interval plus compute time, so requests only
+    compute inline before the first refresh or if the refresh loop stalls.
+    """
+    now = time.monotonic()
+    if _stats_cache["value"] is None or now - _stats_cache["ts"] > ttl:
+        with _stats_lock:
+            if _stats_cache["value"] is None or now - _stats_cache["ts"] > ttl:
+                _stats_cache["value"] = get_system_stats()
+                _stats_cache["ts"] = time.monotonic()
+    return _stats_cache["value"]
+
+
+def _stats_refresh_loop():
+    """Background thread: keep the stats cache warm so /api/stats never computes inline."""
+    while True:
+        try:
+            stats = get_system_stats()
+            with _stats_lock:
+                _stats_cache["value"] = stats
+                _stats_cache["ts"] = time.monotonic()
+        except Exception as e:
+            print(f"Stats refresh failed: {e}")
+        time.sleep(STATS_REFRESH_INTERVAL)
+
+
 @app.route("/robots.txt")
 def robots_txt():
     return send_from_directory(app.static_folder, "robots.txt", mimetype="text/plain")
@@ -520,11 +953,28 @@ def stretch_tracker():
 
 PODCAST_DIR = os.path.join(os.environ.get("DATA_DIR", "C:/projects/aernhome/data"), "podcast")
 PODCAST_ALLOWED_EXT = {".mp3", ".jpg", ".jpeg", ".png"}
+# Internal location of a fronting nginx that aliases PODCAST_DIR, e.g.
+# "/_protected_podcast/". When set, media downloads are handed off with
+# X-Accel-Redirect instead of being streamed through Flask.
+PODCAST_ACCEL_PREFIX = os.environ.get("PODCAST_ACCEL_PREFIX", "")
+
+
+_podcast_cache = {"mtime": None, "data": []}
 
 
 def load_podcast_data():
-    """Load episode metadata from episodes.json, compute file sizes and RFC 2822 dates."""
+    """Load episode metadata from episodes.json, compute file sizes and RFC 2822 dates.
+
+    The computed list is cached and only rebuilt when episodes.json's mtime changes.
+    """
     json_path = os.path.join(PODCAST_DIR, "episodes.json")
+    try:
+        mtime = os.path.getmtime(json_path)
+    except OSError:
+        return []
+    if mtime == _podcast_cache["mtime"]:
+        return _podcast_cache["data"]
+
     try:
         with open(json_path, "r") as f:
             episodes = json.load(f)
@@ -546,6 +996,8 @@ def load_podcast_data():
         except (ValueError, KeyError):
             ep["pub_date_rfc"] = ""
 
+    _podcast_cache["mtime"] = mtime
+    _podcast_cache["data"] = episodes
     return episodes
 
 
@@ -570,7 +1022,18 @@ def podcast_file(filename):
     ext = os.path.splitext(filename)[1].lower()
     if ext not in PODCAST_ALLOWED_EXT:
         abort(403)
-    return send_from_directory(PODCAST_DIR, filename)
+    if not PODCAST_ACCEL_PREFIX:
+        return send_from_directory(PODCAST_DIR, filename)
+
+    # Let nginx do the transfer (sendfile, range requests); Flask only validates
+    path = safe_join(PODCAST_DIR, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    resp = Response(status=200)
+    # nginx parses the header as a URI, so ?, # and % in names must be escaped
+    resp.headers["X-Accel-Redirect"] = PODCAST_ACCEL_PREFIX.rstrip("/") + "/" + quote(filename)
+    resp.headers["Content-Type"] = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    return resp
 
 
 @app.route("/projects")
@@ -579,10 +1042,8 @@ def projects():
     return render_template("projects.html")
 
 
-@app.route("/privacy")
-def privacy():
-    """Privacy policy for Twilio compliance"""
-    return """<!DOCTYPE html>
+# Static legal pages, encoded once at import
+_PRIVACY_HTML = b"""<!DOCTYPE html>
 <html><head><title>Privacy Policy - aern.dev</title>
 <style>body{font-family:system-ui,sans-serif;max-width:700px;margin:40px auto;padding:0 20px;color:#e0e0e0;background:#1a1a2e;line-height:1.6}h1,h2{color:#fff}</style>
 </head><body>
@@ -600,11 +1061,7 @@ def privacy():
 <p>For privacy questions, contact us at the number provided in our messages.</p>
 </body></html>"""
 
-
-@app.route("/tc")
-def terms():
-    """Terms and conditions for Twilio compliance"""
-    return """<!DOCTYPE html>
+_TERMS_HTML = b"""<!DOCTYPE html>
 <html><head><title>Terms &amp; Conditions - aern.dev</title>
 <style>body{font-family:system-ui,sans-serif;max-width:700px;margin:40px auto;padding:0 20px;color:#e0e0e0;background:#1a1a2e;line-height:1.6}h1,h2{color:#fff}</style>
 </head><body>
@@ -629,6 +1086,32 @@ def terms():
 </body></html>"""
 
 
+_STATIC_ETAGS = {
+    body: hashlib.sha1(body).hexdigest()
+    for body in (_PRIVACY_HTML, _TERMS_HTML)
+}
+
+
+def _static_html_response(body):
+    """Return a cacheable HTML response that answers If-None-Match with 304."""
+    resp = make_response(body)
+    resp.headers["Cache-Control"] = "public, max-age=86400"
+    resp.set_etag(_STATIC_ETAGS[body])
+    return resp.make_conditional(request)
+
+
+@app.route("/privacy")
+def privacy():
+    """Privacy policy for Twilio compliance"""
+    return _static_html_response(_PRIVACY_HTML)
+
+
+@app.route("/tc")
+def terms():
+    """Terms and conditions for Twilio compliance"""
+    return _static_html_response(_TERMS_HTML)
+
+
 @app.route("/api/health")
 def api_health():
     """
@@ -636,52 +1119,49 @@ def api_health():
     Returns: JSON with all service statuses (internal only)
     """
     if not _is_internal_request():
-        return jsonify({"status": "ok"})
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM services WHERE enabled = 1")
-    services = [dict(row) for row in cursor.fetchall()]
+        return _json({"status": "ok"})
+    services = _load_services()
 
-    # Fetch last 24h of health checks for sparklines (one query for all services)
+    # Last 24h of health checks downsampled to 5-minute buckets (288/day),
+    # oldest first. A bucket counts as up only if every check in it was up.
+    cursor = get_thread_db().cursor()
     cursor.execute("""
-        SELECT service_id, status, checked_at
+        SELECT service_id,
+               CAST((julianday('now') - julianday(checked_at)) * 288 AS INTEGER) AS bucket,
+               MIN(status = 'up') AS up
         FROM health_checks
         WHERE checked_at >= datetime('now', '-24 hours')
-        ORDER BY checked_at ASC
+        GROUP BY service_id, bucket
+        ORDER BY service_id, bucket DESC
     """)
     sparkline_rows = cursor.fetchall()
-    conn.close()
 
     # Group sparkline data by service_id
     sparklines = {}
     for row in sparkline_rows:
-        sid = row["service_id"]
-        if sid not in sparklines:
-            sparklines[sid] = []
-        sparklines[sid].append(row["status"] == "up")
+        sparklines.setdefault(row["service_id"], []).append(bool(row["up"]))
 
     # Internal clients (Tailscale/LAN) get clickable service links; public internet gets none
     show_links = _is_internal_request()
-    public_urls = {s["name"]: s["public_url"] for s in DEFAULT_SERVICES}
+
+    # Results come from the background loop; the request never waits on a probe
+    with _health_lock:
+        healths = dict(_health_results)
+    pending = {
+        "status": "unknown",
+        "response_time_ms": None,
+        "error_message": "awaiting first check",
+    }
 
     results = []
     for service in services:
-        health = check_service_health(service)
-
-        # Save health check to database
-        save_health_check(
-            service["id"],
-            health["status"],
-            health["response_time_ms"],
-            health["error_message"],
-        )
-
+        health = healths.get(service["id"], pending)
         results.append(
             {
                 "id": service["id"],
                 "name": service["name"],
                 "display_name": service["display_name"],
-                "public_url": public_urls.get(service["name"]) if show_links else None,
+                "public_url": PUBLIC_URLS.get(service["name"]) if show_links else None,
                 "icon_emoji": service["icon_emoji"],
                 "status": health["status"],
                 "response_time_ms": health["response_time_ms"],
@@ -690,7 +1170,7 @@ def api_health():
             }
         )
 
-    return jsonify(results)
+    return _json(results)
 
 
 @app.route("/api/stats")
@@ -701,128 +1181,201 @@ def api_stats():
     Error messages are sanitized to avoid leaking internal paths.
     """
     if not _is_internal_request():
-        return jsonify({"status": "ok"})
-    stats = get_system_stats()
+        return _json({"status": "ok"})
+    # Copy so sanitizing doesn't touch the cached stats
+    stats = {k: dict(v) if isinstance(v, dict) else v for k, v in get_system_stats_cached().items()}
     # Sanitize error messages — replace detailed errors with generic ones
     for key in stats:
         if isinstance(stats[key], dict) and stats[key].get("error"):
             stats[key]["error"] = "unavailable"
-    return jsonify(stats)
+    return _json(stats)
+
+
+class MicroSeason(NamedTuple):
+    """One of the 72 micro-seasons; day_start/day_end may be month-overflow sentinels."""
+
+    month: int
+    day_start: int
+    day_end: int
+    number: int
+    kanji: str
+    romaji: str
+    english: str
+    solar_term: str
+    solar_term_romaji: str
+    solar_term_english: str
+    pentad: int
+    season: str
 
 
 # 72 Japanese micro-seasons (七十二候)
-# Each entry: (month, day_start, day_end, number, kanji, romaji, english,
-#              solar_term, solar_term_romaji, solar_term_english, pentad, season)
 # day_end is inclusive. Seasons that cross month boundaries use day_end=31/32 as
 # a sentinel — the lookup function handles the boundary crossing logic.
-_MICRO_SEASONS = [
+_MICRO_SEASONS: tuple[MicroSeason, ...] = (
     # --- Spring ---
-    (2,  4,  8,  1, "東風解凍", "Harukaze kōri o toku",         "East wind melts the ice",           "立春", "Risshun", "Beginning of Spring", 1, "Spring"),
-    (2,  9, 13,  2, "黄鶯睍睆", "Kōō kenkan su",                "Bush warblers start singing",        "立春", "Risshun", "Beginning of Spring", 2, "Spring"),
-    (2, 14, 18,  3, "魚上氷",   "Uo kōri o izuru",              "Fish emerge from the ice",           "立春", "Risshun", "Beginning of Spring", 3, "Spring"),
-    (2, 19, 23,  4, "土脉潤起", "Tsuchi no shō uruoi okoru",    "Rain moistens the soil",             "雨水", "Usui",    "Rain Water",          1, "Spring"),
-    (2, 24, 28,  5, "霞始靆",   "Kasumi hajimete tanabiku",     "Mist starts to linger",              "雨水", "Usui",    "Rain Water",          2, "Spring"),
-    (3,  1,  5,  6, "草木萠動", "Sōmoku mebae izuru",           "Grass sprouts, trees bud",           "雨水", "Usui",    "Rain Water",          3, "Spring"),
-    (3,  6, 10,  7, "蟄虫啓戸", "Sugomori mushi to o hiraku",   "Hibernating insects surface",        "啓蟄", "Keichitsu","Awakening of Insects",1, "Spring"),
-    (3, 11, 15,  8, "桃始笑",   "Momo hajimete saku",           "First peach blossoms",               "啓蟄", "Keichitsu","Awakening of Insects",2, "Spring"),
-    (3, 16, 20,  9, "菜虫化蝶", "Namushi chō to naru",          "Caterpillars become butterflies",    "啓蟄", "Keichitsu","Awakening of Insects",3, "Spring"),
-    (3, 21, 25, 10, "雀始巣",   "Suzume hajimete sukū",         "Sparrows start to nest",             "春分", "Shunbun", "Spring Equinox",      1, "Spring"),
-    (3, 26, 30, 11, "櫻始開",   "Sakura hajimete saku",         "First cherry blossoms",              "春分", "Shunbun", "Spring Equinox",      2, "Spring"),
+    MicroSeason(2,  4,  8,  1, "東風解凍", "Harukaze kōri o toku",         "East wind melts the ice",           "立春", "Risshun", "Beginning of Spring", 1, "Spring"),
+    MicroSeason(2,  9, 13,  2, "黄鶯睍睆", "Kōō kenkan su",                "Bush warblers start singing",        "立春", "Risshun", "Beginning of Spring", 2, "Spring"),
+    MicroSeason(2, 14, 18,  3, "魚上氷",   "Uo kōri o izuru",              "Fish emerge from the ice",           "立春", "Risshun", "Beginning of Spring", 3, "Spring"),
+    MicroSeason(2, 19, 23,  4, "土脉潤起", "Tsuchi no shō uruoi okoru",    "Rain moistens the soil",             "雨水", "Usui",    "Rain Water",          1, "Spring"),
+    MicroSeason(2, 24, 28,  5, "霞始靆",   "Kasumi hajimete tanabiku",     "Mist starts to linger",              "雨水", "Usui",    "Rain Water",          2, "Spring"),
+    MicroSeason(3,  1,  5,  6, "草木萠動", "Sōmoku mebae izuru",           "Grass sprouts, trees bud",           "雨水", "Usui",    "Rain Water",          3, "Spring"),
+    MicroSeason(3,  6, 10,  7, "蟄虫啓戸", "Sugomori mushi to o hiraku",   "Hibernating insects surface",        "啓蟄", "Keichitsu","Awakening of Insects",1, "Spring"),
+    MicroSeason(3, 11, 15,  8, "桃始笑",   "Momo hajimete saku",           "First peach blossoms",               "啓蟄", "Keichitsu","Awakening of Insects",2, "Spring"),
+    MicroSeason(3, 16, 20,  9, "菜虫化蝶", "Namushi chō to naru",          "Caterpillars become butterflies",    "啓蟄", "Keichitsu","Awakening of Insects",3, "Spring"),
+    MicroSeason(3, 21, 25, 10, "雀始巣",   "Suzume hajimete sukū",         "Sparrows start to nest",             "春分", "Shunbun", "Spring Equinox",      1, "Spring"),
+    MicroSeason(3, 26, 30, 11, "櫻始開",   "Sakura hajimete saku",         "First cherry blossoms",              "春分", "Shunbun", "Spring Equinox",      2, "Spring"),
     # Mar 31 – Apr 4 (crosses month boundary; stored as month=3, day_start=31, day_end=35 sentinel)
-    (3, 31, 35, 12, "雷乃発声", "Kaminari sunawachi koe o hassu","Distant thunder",                   "春分", "Shunbun", "Spring Equinox",      3, "Spring"),
-    (4,  5,  9, 13, "玄鳥至",   "Tsubame kitaru",               "Swallows return",                    "清明", "Seimei",  "Pure Brightness",     1, "Spring"),
-    (4, 10, 14, 14, "鴻雁北",   "Kōgan kaeru",                  "Wild geese fly north",               "清明", "Seimei",  "Pure Brightness",     2, "Spring"),
-    (4, 15, 19, 15, "虹始見",   "Niji hajimete arawaru",        "First rainbows",                     "清明", "Seimei",  "Pure Brightness",     3, "Spring"),
-    (4, 20, 24, 16, "葭始生",   "Ashi hajimete shōzu",          "First reeds sprout",                 "穀雨", "Kokuu",   "Grain Rain",          1, "Spring"),
-    (4, 25, 29, 17, "霜止出苗", "Shimo yamite nae izuru",       "Last frost, rice seedlings grow",    "穀雨", "Kokuu",   "Grain Rain",          2, "Spring"),
+    MicroSeason(3, 31, 35, 12, "雷乃発声", "Kaminari sunawachi koe o hassu","Distant thunder",                   "春分", "Shunbun", "Spring Equinox",      3, "Spring"),
+    MicroSeason(4,  5,  9, 13, "玄鳥至",   "Tsubame kitaru",               "Swallows return",                    "清明", "Seimei",  "Pure Brightness",     1, "Spring"),
+    MicroSeason(4, 10, 14, 14, "鴻雁北",   "Kōgan kaeru",                  "Wild geese fly north",               "清明", "Seimei",  "Pure Brightness",     2, "Spring"),
+    MicroSeason(4, 15, 19, 15, "虹始見",   "Niji hajimete arawaru",        "First rainbows",                     "清明", "Seimei",  "Pure Brightness",     3, "Spring"),
+    MicroSeason(4, 20, 24, 16, "葭始生",   "Ashi hajimete shōzu",          "First reeds sprout",                 "穀雨", "Kokuu",   "Grain Rain",          1, "Spring"),
+    MicroSeason(4, 25, 29, 17, "霜止出苗", "Shimo yamite nae izuru",       "Last frost, rice seedlings grow",    "穀雨", "Kokuu",   "Grain Rain",          2, "Spring"),
     # Apr 30 – May 4 (crosses month boundary; stored as month=4, day_start=30, day_end=35 sentinel)
-    (4, 30, 35, 18, "牡丹華",   "Botan hana saku",              "Peonies bloom",                      "穀雨", "Kokuu",   "Grain Rain",          3, "Spring"),
+    MicroSeason(4, 30, 35, 18, "牡丹華",   "Botan hana saku",              "Peonies bloom",                      "穀雨", "Kokuu",   "Grain Rain",          3, "Spring"),
     # --- Summer ---
-    (5,  5,  9, 19, "蛙始鳴",   "Kawazu hajimete naku",         "Frogs start singing",                "立夏", "Rikka",   "Beginning of Summer", 1, "Summer"),
-    (5, 10, 14, 20, "蚯蚓出",   "Mimizu izuru",                 "Worms surface",                      "立夏", "Rikka",   "Beginning of Summer", 2, "Summer"),
-    (5, 15, 20, 21, "竹笋生",   "Takenoko shōzu",               "Bamboo shoots sprout",               "立夏", "Rikka",   "Beginning of Summer", 3, "Summer"),
-    (5, 21, 25, 22, "蚕起食桑", "Kaiko okite kuwa o hamu",      "Silkworms feast on mulberry",        "小満", "Shōman",  "Lesser Fullness",     1, "Summer"),
-    (5, 26, 30, 23, "紅花栄",   "Benibana sakau",               "Safflowers bloom",                   "小満", "Shōman",  "Lesser Fullness",     2, "Summer"),
+    MicroSeason(5,  5,  9, 19, "蛙始鳴",   "Kawazu hajimete naku",         "Frogs start singing",                "立夏", "Rikka",   "Beginning of Summer", 1, "Summer"),
+    MicroSeason(5, 10, 14, 20, "蚯蚓出",   "Mimizu izuru",                 "Worms surface",                      "立夏", "Rikka",   "Beginning of Summer", 2, "Summer"),
+    MicroSeason(5, 15, 20, 21, "竹笋生",   "Takenoko shōzu",               "Bamboo shoots sprout",               "立夏", "Rikka",   "Beginning of Summer", 3, "Summer"),
+    MicroSeason(5, 21, 25, 22, "蚕起食桑", "Kaiko okite kuwa o hamu",      "Silkworms feast on mulberry",        "小満", "Shōman",  "Lesser Fullness",     1, "Summer"),
+    MicroSeason(5, 26, 30, 23, "紅花栄",   "Benibana sakau",               "Safflowers bloom",                   "小満", "Shōman",  "Lesser Fullness",     2, "Summer"),
     # May 31 – Jun 5 (crosses month boundary; stored as month=5, day_start=31, day_end=36 sentinel)
-    (5, 31, 36, 24, "麦秋至",   "Mugi no toki itaru",           "Wheat ripens",                       "小満", "Shōman",  "Lesser Fullness",     3, "Summer"),
-    (6,  6, 10, 25, "蟷螂生",   "Kamakiri shōzu",               "Praying mantises hatch",             "芒種", "Bōshu",   "Grain in Ear",        1, "Summer"),
-    (6, 11, 15, 26, "腐草為蛍", "Kusaretaru kusa hotaru to naru","Fireflies emerge",                  "芒種", "Bōshu",   "Grain in Ear",        2, "Summer"),
-    (6, 16, 20, 27, "梅子黄",   "Ume no mi kibamu",             "Plums turn yellow",                  "芒種", "Bōshu",   "Grain in Ear",        3, "Summer"),
-    (6, 21, 26, 28, "乃東枯",   "Natsukarekusa karuru",         "Self-heal withers",                  "夏至", "Geshi",   "Summer Solstice",     1, "Summer"),
+    MicroSeason(5, 31, 36, 24, "麦秋至",   "Mugi no toki itaru",           "Wheat ripens",                       "小満", "Shōman",  "Lesser Fullness",     3, "Summer"),
+    MicroSeason(6,  6, 10, 25, "蟷螂生",   "Kamakiri shōzu",               "Praying mantises hatch",             "芒種", "Bōshu",   "Grain in Ear",        1, "Summer"),
+    MicroSeason(6, 11, 15, 26, "腐草為蛍", "Kusaretaru kusa hotaru to naru","Fireflies emerge",                  "芒種", "Bōshu",   "Grain in Ear",        2, "Summer"),
+    MicroSeason(6, 16, 20, 27, "梅子黄",   "Ume no mi kibamu",             "Plums turn yellow",                  "芒種", "Bōshu",   "Grain in Ear",        3, "Summer"),
+    MicroSeason(6, 21, 26, 28, "乃東枯",   "Natsukarekusa karuru",         "Self-heal withers",                  "夏至", "Geshi",   "Summer Solstice",     1, "Summer"),
     # Jun 27 – Jul 1 (crosses month boundary; stored as month=6, day_start=27, day_end=32 sentinel)
-    (6, 27, 32, 29, "菖蒲華",   "Ayame hana saku",              "Irises bloom",                       "夏至", "Geshi",   "Summer Solstice",     2, "Summer"),
-    (7,  2,  6, 30, "半夏生",   "Hange shōzu",                  "Crow-dipper sprouts",                "夏至", "Geshi",   "Summer Solstice",     3, "Summer"),
-    (7,  7, 11, 31, "温風至",   "Atsukaze itaru",               "Warm winds blow",                    "小暑", "Shōsho",  "Lesser Heat",         1, "Summer"),
-    (7, 12, 16, 32, "蓮始開",   "Hasu hajimete hiraku",         "Lotus flowers bloom",                "小暑", "Shōsho",  "Lesser Heat",         2, "Summer"),
-    (7, 17, 22, 33, "鷹乃学習", "Taka sunawachi waza o narau",  "Hawks learn to fly",                 "小暑", "Shōsho",  "Lesser Heat",         3, "Summer"),
-    (7, 23, 28, 34, "桐始結花", "Kiri hajimete hana o musubu",  "Paulownia trees flower",             "大暑", "Taisho",  "Greater Heat",        1, "Summer"),
+    MicroSeason(6, 27, 32, 29, "菖蒲華",   "Ayame hana saku",              "Irises bloom",                       "夏至", "Geshi",   "Summer Solstice",     2, "Summer"),
+    MicroSeason(7,  2,  6, 30, "半夏生",   "Hange shōzu",                  "Crow-dipper sprouts",                "夏至", "Geshi",   "Summer Solstice",     3, "Summer"),
+    MicroSeason(7,  7, 11, 31, "温風至",   "Atsukaze itaru",               "Warm winds blow",                    "小暑", "Shōsho",  "Lesser Heat",         1, "Summer"),
+    MicroSeason(7, 12, 16, 32, "蓮始開",   "Hasu hajimete hiraku",         "Lotus flowers bloom",                "小暑", "Shōsho",  "Lesser Heat",         2, "Summer"),
+    MicroSeason(7, 17, 22, 33, "鷹乃学習", "Taka sunawachi waza o narau",  "Hawks learn to fly",                 "小暑", "Shōsho",  "Lesser Heat",         3, "Summer"),
+    MicroSeason(7, 23, 28, 34, "桐始結花", "Kiri hajimete hana o musubu",  "Paulownia trees flower",             "大暑", "Taisho",  "Greater Heat",        1, "Summer"),
     # Jul 29 – Aug 2 (crosses month boundary; stored as month=7, day_start=29, day_end=33 sentinel)
-    (7, 29, 33, 35, "土潤溽暑", "Tsuchi uruōte mushi atsushi",  "Earth is damp, air humid",           "大暑", "Taisho",  "Greater Heat",        2, "Summer"),
-    (8,  3,  6, 36, "大雨時行", "Taiu tokidoki furu",           "Great rains sometimes fall",          "大暑", "Taisho",  "Greater Heat",        3, "Summer"),
+    MicroSeason(7, 29, 33, 35, "土潤溽暑", "Tsuchi uruōte mushi atsushi",  "Earth is damp, air humid",           "大暑", "Taisho",  "Greater Heat",        2, "Summer"),
+    MicroSeason(8,  3,  6, 36, "大雨時行", "Taiu tokidoki furu",           "Great rains sometimes fall",          "大暑", "Taisho",  "Greater Heat",        3, "Summer"),
     # --- Autumn ---
-    (8,  7, 11, 37, "涼風至",   "Suzukaze itaru",               "Cool winds arrive",                  "立秋", "Risshū",  "Beginning of Autumn", 1, "Autumn"),
-    (8, 12, 16, 38, "寒蝉鳴",   "Higurashi naku",               "Evening cicadas sing",               "立秋", "Risshū",  "Beginning of Autumn", 2, "Autumn"),
-    (8, 17, 22, 39, "蒙霧升降", "Fukaki kiri matō",             "Dense fog descends",                 "立秋", "Risshū",  "Beginning of Autumn", 3, "Autumn"),
-    (8, 23, 27, 40, "綿柎開",   "Wata no hana shibe hiraku",    "Cotton flowers bloom",               "処暑", "Shosho",  "End of Heat",         1, "Autumn"),
+    MicroSeason(8,  7, 11, 37, "涼風至",   "Suzukaze itaru",               "Cool winds arrive",                  "立秋", "Risshū",  "Beginning of Autumn", 1, "Autumn"),
+    MicroSeason(8, 12, 16, 38, "寒蝉鳴",   "Higurashi naku",               "Evening cicadas sing",               "立秋", "Risshū",  "Beginning of Autumn", 2, "Autumn"),
+    MicroSeason(8, 17, 22, 39, "蒙霧升降", "Fukaki kiri matō",             "Dense fog descends",                 "立秋", "Risshū",  "Beginning of Autumn", 3, "Autumn"),
+    MicroSeason(8, 23, 27, 40, "綿柎開",   "Wata no hana shibe hiraku",    "Cotton flowers bloom",               "処暑", "Shosho",  "End of Heat",         1, "Autumn"),
     # Aug 28 – Sep 1 (crosses month boundary; stored as month=8, day_start=28, day_end=32 sentinel)
-    (8, 28, 32, 41, "天地始粛", "Tenchi hajimete samushi",      "Heat begins to subside",             "処暑", "Shosho",  "End of Heat",         2, "Autumn"),
-    (9,  2,  7, 42, "禾乃登",   "Kokumono sunawachi minoru",    "Rice ripens",                        "処暑", "Shosho",  "End of Heat",         3, "Autumn"),
-    (9,  8, 12, 43, "草露白",   "Kusa no tsuyu shiroshi",       "Dew glistens white on grass",        "白露", "Hakuro",  "White Dew",           1, "Autumn"),
-    (9, 13, 17, 44, "鶺鴒鳴",   "Sekirei naku",                 "Wagtails sing",                      "白露", "Hakuro",  "White Dew",           2, "Autumn"),
-    (9, 18, 22, 45, "玄鳥去",   "Tsubame saru",                 "Swallows leave",                     "白露", "Hakuro",  "White Dew",           3, "Autumn"),
-    (9, 23, 27, 46, "雷乃収声", "Kaminari sunawachi koe o osamu","Thunder ceases",                    "秋分", "Shūbun",  "Autumn Equinox",      1, "Autumn"),
+    MicroSeason(8, 28, 32, 41, "天地始粛", "Tenchi hajimete samushi",      "Heat begins to subside",             "処暑", "Shosho",  "End of Heat",         2, "Autumn"),
+    MicroSeason(9,  2,  7, 42, "禾乃登",   "Kokumono sunawachi minoru",    "Rice ripens",                        "処暑", "Shosho",  "End of Heat",         3, "Autumn"),
+    MicroSeason(9,  8, 12, 43, "草露白",   "Kusa no tsuyu shiroshi",       "Dew glistens white on grass",        "白露", "Hakuro",  "White Dew",           1, "Autumn"),
+    MicroSeason(9, 13, 17, 44, "鶺鴒鳴",   "Sekirei naku",                 "Wagtails sing",                      "白露", "Hakuro",  "White Dew",           2, "Autumn"),
+    MicroSeason(9, 18, 22, 45, "玄鳥去",   "Tsubame saru",                 "Swallows leave",                     "白露", "Hakuro",  "White Dew",           3, "Autumn"),
+    MicroSeason(9, 23, 27, 46, "雷乃収声", "Kaminari sunawachi koe o osamu","Thunder ceases",                    "秋分", "Shūbun",  "Autumn Equinox",      1, "Autumn"),
     # Sep 28 – Oct 2 (crosses month boundary; stored as month=9, day_start=28, day_end=32 sentinel)
-    (9, 28, 32, 47, "蟄虫坏戸", "Mushi kakurete to o fusagu",   "Insects hide and seal doors",        "秋分", "Shūbun",  "Autumn Equinox",      2, "Autumn"),
-    (10, 3,  7, 48, "水始涸",   "Mizu hajimete karuru",         "Farmers drain fields",               "秋分", "Shūbun",  "Autumn Equinox",      3, "Autumn"),
-    (10, 8, 12, 49, "鴻雁来",   "Kōgan kitaru",                 "Wild geese return",                  "寒露", "Kanro",   "Cold Dew",            1, "Autumn"),
-    (10,13, 17, 50, "菊花開",   "Kiku no hana hiraku",          "Chrysanthemums bloom",               "寒露", "Kanro",   "Cold Dew",            2, "Autumn"),
-    (10,18, 22, 51, "蟋蟀在戸", "Kirigirisu to ni ari",         "Crickets chirp by the door",         "寒露", "Kanro",   "Cold Dew",            3, "Autumn"),
-    (10,23, 27, 52, "霜始降",   "Shimo hajimete furu",          "First frost",                        "霜降", "Sōkō",    "Frost Falls",         1, "Autumn"),
+    MicroSeason(9, 28, 32, 47, "蟄虫坏戸", "Mushi kakurete to o fusagu",   "Insects hide and seal doors",        "秋分", "Shūbun",  "Autumn Equinox",      2, "Autumn"),
+    MicroSeason(10, 3,  7, 48, "水始涸",   "Mizu hajimete karuru",         "Farmers drain fields",               "秋分", "Shūbun",  "Autumn Equinox",      3, "Autumn"),
+    MicroSeason(10, 8, 12, 49, "鴻雁来",   "Kōgan kitaru",                 "Wild geese return",                  "寒露", "Kanro",   "Cold Dew",            1, "Autumn"),
+    MicroSeason(10,13, 17, 50, "菊花開",   "Kiku no hana hiraku",          "Chrysanthemums bloom",               "寒露", "Kanro",   "Cold Dew",            2, "Autumn"),
+    MicroSeason(10,18, 22, 51, "蟋蟀在戸", "Kirigirisu to ni ari",         "Crickets chirp by the door",         "寒露", "Kanro",   "Cold Dew",            3, "Autumn"),
+    MicroSeason(10,23, 27, 52, "霜始降",   "Shimo hajimete furu",          "First frost",                        "霜降", "Sōkō",    "Frost Falls",         1, "Autumn"),
     # Oct 28 – Nov 1 (crosses month boundary; stored as month=10, day_start=28, day_end=32 sentinel)
-    (10,28, 32, 53, "霎時施",   "Kosame tokidoki furu",         "Light rains sometimes fall",         "霜降", "Sōkō",    "Frost Falls",         2, "Autumn"),
-    (11, 2,  6, 54, "楓蔦黄",   "Momiji tsuta kibamu",          "Maples and ivy turn yellow",         "霜降", "Sōkō",    "Frost Falls",         3, "Autumn"),
+    MicroSeason(10,28, 32, 53, "霎時施",   "Kosame tokidoki furu",         "Light rains sometimes fall",         "霜降", "Sōkō",    "Frost Falls",         2, "Autumn"),
+    MicroSeason(11, 2,  6, 54, "楓蔦黄",   "Momiji tsuta kibamu",          "Maples and ivy turn yellow",         "霜降", "Sōkō",    "Frost Falls",         3, "Autumn"),
     # --- Winter ---
-    (11, 7, 11, 55, "山茶始開", "Tsubaki hajimete hiraku",      "Camellias bloom",                    "立冬", "Rittō",   "Beginning of Winter", 1, "Winter"),
-    (11,12, 16, 56, "地始凍",   "Chi hajimete kōru",            "Ground starts to freeze",            "立冬", "Rittō",   "Beginning of Winter", 2, "Winter"),
-    (11,17, 21, 57, "金盞香",   "Kinsenka saku",                "Daffodils bloom",                    "立冬", "Rittō",   "Beginning of Winter", 3, "Winter"),
-    (11,22, 26, 58, "虹蔵不見", "Niji kakurete miezu",          "Rainbows hide",                      "小雪", "Shōsetsu","Lesser Snow",         1, "Winter"),
+    MicroSeason(11, 7, 11, 55, "山茶始開", "Tsubaki hajimete hiraku",      "Camellias bloom",                    "立冬", "Rittō",   "Beginning of Winter", 1, "Winter"),
+    MicroSeason(11,12, 16, 56, "地始凍",   "Chi hajimete kōru",            "Ground starts to freeze",            "立冬", "Rittō",   "Beginning of Winter", 2, "Winter"),
+    MicroSeason(11,17, 21, 57, "金盞香",   "Kinsenka saku",                "Daffodils bloom",                    "立冬", "Rittō",   "Beginning of Winter", 3, "Winter"),
+    MicroSeason(11,22, 26, 58, "虹蔵不見", "Niji kakurete miezu",          "Rainbows hide",                      "小雪", "Shōsetsu","Lesser Snow",         1, "Winter"),
     # Nov 27 – Dec 1 (crosses month boundary; stored as month=11, day_start=27, day_end=32 sentinel)
-    (11,27, 32, 59, "朔風払葉", "Kitakaze konoha o harau",      "North wind blows leaves",            "小雪", "Shōsetsu","Lesser Snow",         2, "Winter"),
-    (12, 2,  6, 60, "橘始黄",   "Tachibana hajimete kibamu",    "Mandarin oranges turn yellow",       "小雪", "Shōsetsu","Lesser Snow",         3, "Winter"),
-    (12, 7, 11, 61, "閉塞成冬", "Sora samuku fuyu to naru",     "Cold sets in, winter arrives",       "大雪", "Taisetsu","Greater Snow",        1, "Winter"),
-    (12,12, 16, 62, "熊蟄穴",   "Kuma ana ni komoru",           "Bears retreat to dens",              "大雪", "Taisetsu","Greater Snow",        2, "Winter"),
-    (12,17, 21, 63, "鱖魚群",   "Sake no uo muragaru",          "Salmon gather in rivers",            "大雪", "Taisetsu","Greater Snow",        3, "Winter"),
-    (12,22, 26, 64, "乃東生",   "Natsukarekusa shōzu",          "Self-heal sprouts",                  "冬至", "Tōji",    "Winter Solstice",     1, "Winter"),
-    (12,27, 31, 65, "麋角解",   "Sawashika no tsuno otsuru",    "Deer shed antlers",                  "冬至", "Tōji",    "Winter Solstice",     2, "Winter"),
+    MicroSeason(11,27, 32, 59, "朔風払葉", "Kitakaze konoha o harau",      "North wind blows leaves",            "小雪", "Shōsetsu","Lesser Snow",         2, "Winter"),
+    MicroSeason(12, 2,  6, 60, "橘始黄",   "Tachibana hajimete kibamu",    "Mandarin oranges turn yellow",       "小雪", "Shōsetsu","Lesser Snow",         3, "Winter"),
+    MicroSeason(12, 7, 11, 61, "閉塞成冬", "Sora samuku fuyu to naru",     "Cold sets in, winter arrives",       "大雪", "Taisetsu","Greater Snow",        1, "Winter"),
+    MicroSeason(12,12, 16, 62, "熊蟄穴",   "Kuma ana ni komoru",           "Bears retreat to dens",              "大雪", "Taisetsu","Greater Snow",        2, "Winter"),
+    MicroSeason(12,17, 21, 63, "鱖魚群",   "Sake no uo muragaru",          "Salmon gather in rivers",            "大雪", "Taisetsu","Greater Snow",        3, "Winter"),
+    MicroSeason(12,22, 26, 64, "乃東生",   "Natsukarekusa shōzu",          "Self-heal sprouts",                  "冬至", "Tōji",    "Winter Solstice",     1, "Winter"),
+    MicroSeason(12,27, 31, 65, "麋角解",   "Sawashika no tsuno otsuru",    "Deer shed antlers",                  "冬至", "Tōji",    "Winter Solstice",     2, "Winter"),
     # Jan 1-4 wraps to next year; stored as month=12, day_start=32, day_end=35 sentinel
-    (12,32, 35, 66, "雪下出麦", "Yuki watarite mugi nobiru",    "Wheat sprouts under snow",           "冬至", "Tōji",    "Winter Solstice",     3, "Winter"),
-    (1,  5,  9, 67, "芹乃栄",   "Seri sunawachi sakau",         "Parsley flourishes",                 "小寒", "Shōkan",  "Lesser Cold",         1, "Winter"),
-    (1, 10, 14, 68, "水泉動",   "Shimizu atataka o fukumu",     "Springs thaw",                       "小寒", "Shōkan",  "Lesser Cold",         2, "Winter"),
-    (1, 15, 19, 69, "雉始雊",   "Kiji hajimete naku",           "Pheasants start to call",            "小寒", "Shōkan",  "Lesser Cold",         3, "Winter"),
-    (1, 20, 24, 70, "款冬華",   "Fuki no hana saku",            "Butterburs bud",                     "大寒", "Daikan",  "Greater Cold",        1, "Winter"),
-    (1, 25, 29, 71, "水沢腹堅", "Sawamizu kōri tsumeru",        "Ice thickens on streams",            "大寒", "Daikan",  "Greater Cold",        2, "Winter"),
+    MicroSeason(12,32, 35, 66, "雪下出麦", "Yuki watarite mugi nobiru",    "Wheat sprouts under snow",           "冬至", "Tōji",    "Winter Solstice",     3, "Winter"),
+    MicroSeason(1,  5,  9, 67, "芹乃栄",   "Seri sunawachi sakau",         "Parsley flourishes",                 "小寒", "Shōkan",  "Lesser Cold",         1, "Winter"),
+    MicroSeason(1, 10, 14, 68, "水泉動",   "Shimizu atataka o fukumu",     "Springs thaw",                       "小寒", "Shōkan",  "Lesser Cold",         2, "Winter"),
+    MicroSeason(1, 15, 19, 69, "雉始雊",   "Kiji hajimete naku",           "Pheasants start to call",            "小寒", "Shōkan",  "Lesser Cold",         3, "Winter"),
+    MicroSeason(1, 20, 24, 70, "款冬華",   "Fuki no hana saku",            "Butterburs bud",                     "大寒", "Daikan",  "Greater Cold",        1, "Winter"),
+    MicroSeason(1, 25, 29, 71, "水沢腹堅", "Sawamizu kōri tsumeru",        "Ice thickens on streams",            "大寒", "Daikan",  "Greater Cold",        2, "Winter"),
     # Jan 30 – Feb 3 (crosses month boundary; stored as month=1, day_start=30, day_end=34 sentinel)
-    (1, 30, 34, 72, "鶏始乳",   "Niwatori hajimete toya ni tsuku","Hens begin to lay",               "大寒", "Daikan",  "Greater Cold",        3, "Winter"),
-]
+    MicroSeason(1, 30, 34, 72, "鶏始乳",   "Niwatori hajimete toya ni tsuku","Hens begin to lay",               "大寒", "Daikan",  "Greater Cold",        3, "Winter"),
+)
+
+# Date columns of _MICRO_SEASONS, for the lookup-table build below
+_MONTHS, _DAY_STARTS, _DAY_ENDS = list(zip(*_MICRO_SEASONS))[:3]
+
+# Indexed by month (1-12); February uses the non-leap length the sentinels assume
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _build_micro_season(s: MicroSeason) -> dict:
+    """
+    Build the API payload for one _MICRO_SEASONS entry.
+
+    Args:
+        s: A _MICRO_SEASONS entry.
+
+    Returns:
+        Dict with all micro-season fields, including display start/end dates.
+    """
+    m, d_start, d_end = s.month, s.day_start, s.day_end
+
+    # Build human-readable start/end using the canonical spec dates, not sentinels
+    days_in = _DAYS_IN_MONTH[m]
+
+    real_start_d = d_start if d_start <= days_in else d_start - days_in
+    real_start_m = m if d_start <= days_in else (m % 12) + 1
 
-# Lookup table: maps (month, day_of_month) to season index
-# Built at module load so the route itself is O(1)
-_SEASON_BY_MONTH_DAY: dict[tuple[int, int], int] = {}
+    real_end_d = d_end if d_end <= days_in else d_end - days_in
+    real_end_m = m if d_end <= days_in else (m % 12) + 1
 
-for _i, _s in enumerate(_MICRO_SEASONS):
-    _m, _d_start, _d_end = _s[0], _s[1], _s[2]
+    start_str = f"{_MONTH_ABBR[real_start_m]} {real_start_d}"
+    end_str   = f"{_MONTH_ABBR[real_end_m]} {real_end_d}"
+
+    return {
+        "number": s.number,
+        "total": 72,
+        "kanji": s.kanji,
+        "romaji": s.romaji,
+        "english": s.english,
+        "start": start_str,
+        "end": end_str,
+        "solar_term": s.solar_term,
+        "solar_term_romaji": s.solar_term_romaji,
+        "solar_term_english": s.solar_term_english,
+        "pentad": s.pentad,
+        "season": s.season,
+    }
+
+
+# Payload per season, built once so lookups do no unpacking or formatting
+_MICRO_SEASON_RESULTS: list[dict] = [_build_micro_season(_s) for _s in _MICRO_SEASONS]
+
+
+# Leap-year day-of-year of the day before each month starts; index 13 is the
+# year length, so days in month m are _YDAY_OFFSET[m + 1] - _YDAY_OFFSET[m]
+_YDAY_OFFSET = (0, 0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366)
+
+# Lookup table: maps leap-year day-of-year (1-366) to the season payload
+# Built at module load so the route itself is a single list index
+_SEASON_BY_YDAY: list[dict | None] = [None] * 367
+
+for _i, (_m, _d_start, _d_end) in enumerate(zip(_MONTHS, _DAY_STARTS, _DAY_ENDS)):
     for _d in range(_d_start, _d_end + 1):
         # Sentinel days beyond the real month end map to the next month's early days
-        _days_in_month = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30,
-                          7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
-        _real_max = _days_in_month.get(_m, 31)
+        _real_max = _DAYS_IN_MONTH[_m]
         if _d <= _real_max:
-            _SEASON_BY_MONTH_DAY[(_m, _d)] = _i
+            _SEASON_BY_YDAY[_YDAY_OFFSET[_m] + _d] = _MICRO_SEASON_RESULTS[_i]
         else:
             # Overflow into the next month
             _next_m = (_m % 12) + 1
             _next_d = _d - _real_max
-            _SEASON_BY_MONTH_DAY[(_next_m, _next_d)] = _i
+            _SEASON_BY_YDAY[_YDAY_OFFSET[_next_m] + _next_d] = _MICRO_SEASON_RESULTS[_i]
+
+# Feb 29 continues the season that runs through Feb 28
+_SEASON_BY_YDAY[_YDAY_OFFSET[2] + 29] = _SEASON_BY_YDAY[_YDAY_OFFSET[2] + 28]
 
 
 def _get_current_micro_season(month: int, day: int) -> dict:
@@ -836,42 +1389,20 @@ def _get_current_micro_season(month: int, day: int) -> dict:
     Returns:
         Dict with all micro-season fields, or an error dict if not found.
     """
-    idx = _SEASON_BY_MONTH_DAY.get((month, day))
-    if idx is None:
-        return {"error": f"No micro-season found for {month}/{day}"}
-
-    s = _MICRO_SEASONS[idx]
-    (m, d_start, d_end, number, kanji, romaji, english,
-     solar_term, solar_term_romaji, solar_term_english, pentad, season) = s
-
-    # Build human-readable start/end using the canonical spec dates, not sentinels
-    _month_abbr = {1:"Jan",2:"Feb",3:"Mar",4:"Apr",5:"May",6:"Jun",
-                   7:"Jul",8:"Aug",9:"Sep",10:"Oct",11:"Nov",12:"Dec"}
-    _days_in = {1:31,2:28,3:31,4:30,5:31,6:30,7:31,8:31,9:30,10:31,11:30,12:31}
-
-    real_start_d = d_start if d_start <= _days_in.get(m, 31) else d_start - _days_in.get(m, 31)
-    real_start_m = m if d_start <= _days_in.get(m, 31) else (m % 12) + 1
-
-    real_end_d = d_end if d_end <= _days_in.get(m, 31) else d_end - _days_in.get(m, 31)
-    real_end_m = m if d_end <= _days_in.get(m, 31) else (m % 12) + 1
+    if 1 <= month <= 12 and 1 <= day <= _YDAY_OFFSET[month + 1] - _YDAY_OFFSET[month]:
+        result = _SEASON_BY_YDAY[_YDAY_OFFSET[month] + day]
+        if result is not None:
+            return result
+    return {"error": f"No micro-season found for {month}/{day}"}
 
-    start_str = f"{_month_abbr[real_start_m]} {real_start_d}"
-    end_str   = f"{_month_abbr[real_end_m]} {real_end_d}"
 
-    return {
-        "number": number,
-        "total": 72,
-        "kanji": kanji,
-        "romaji": romaji,
-        "english": english,
-        "start": start_str,
-        "end": end_str,
-        "solar_term": solar_term,
-        "solar_term_romaji": solar_term_romaji,
-        "solar_term_english": solar_term_english,
-        "pentad": pentad,
-        "season": season,
-    }
+@functools.lru_cache(maxsize=400)
+def _season_json_bytes(month: int, day: int) -> bytes:
+    """Serialized /api/season body for a date; at most 366 distinct keys."""
+    result = _get_current_micro_season(month, day)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result)
+    return json.dumps(result).encode("utf-8")
 
 
 @app.route("/api/season")
@@ -881,12 +1412,14 @@ def api_season():
     Returns: JSON with season number, kanji, romaji, English description,
              date range, solar term, pentad, and astronomical season.
     """
-    today = datetime.now()
-    result = _get_current_micro_season(today.month, today.day)
-    return jsonify(result)
+    today = date.today()
+    return Response(_season_json_bytes(today.month, today.day), mimetype="application/json")
 
 
 if __name__ == "__main__":
     init_db()
+    start_background_workers()
+    from waitress import serve
+
     # Bind to 0.0.0.0 to allow external access (Tailscale)
-    app.run(host="0.0.0.0", port=5555, debug=False)
+    serve(app, host="0.0.0.0", port=5555, threads=8, connection_limit=100)